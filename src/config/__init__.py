@@ -4,12 +4,14 @@ Configuration package for game settings and constants.
 
 from .constants import GameConstants, LLMConstants
 from .enums import ActionType, DecisionType, Direction, PlayerType
-from .game_config import GameConfigs
+from .game_config import MOVE_POLES, MOVE_TRANSLATIONS, GameConfigs
 
 __all__ = [
     "GameConstants",
     "LLMConstants",
     "GameConfigs",
+    "MOVE_POLES",
+    "MOVE_TRANSLATIONS",
     "ActionType",
     "DecisionType",
     "Direction",
@@ -25,6 +25,7 @@ class GameConstants:
 
     # NPC behavior
     NPC_MOVE_PROBABILITY = 0.2  # 0.0 = never move, 1.0 = always move (vs TALK/INTERACT)
+    PARALLEL_NPC_DECISIONS = True  # Ask all NPCs for their decisions at once each round
 
     # Memory limits
     MAX_MEMORY_EVENTS = 50
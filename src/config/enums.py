@@ -27,24 +27,28 @@ class Direction(Enum):
     @property
     def opposite(self) -> "Direction":
         """Get the opposite direction."""
-        opposites = {
-            Direction.NORTH: Direction.SOUTH,
-            Direction.SOUTH: Direction.NORTH,
-            Direction.EAST: Direction.WEST,
-            Direction.WEST: Direction.EAST,
-        }
-        return opposites[self]
+        return _OPPOSITES[self]
 
     @property
     def translation(self) -> tuple[int, int]:
         """Get the coordinate translation for this direction."""
-        translations = {
-            Direction.NORTH: (0, 1),
-            Direction.SOUTH: (0, -1),
-            Direction.EAST: (1, 0),
-            Direction.WEST: (-1, 0),
-        }
-        return translations[self]
+        return _TRANSLATIONS[self]
+
+
+# Built once at import instead of on every property access
+_OPPOSITES = {
+    Direction.NORTH: Direction.SOUTH,
+    Direction.SOUTH: Direction.NORTH,
+    Direction.EAST: Direction.WEST,
+    Direction.WEST: Direction.EAST,
+}
+
+_TRANSLATIONS = {
+    Direction.NORTH: (0, 1),
+    Direction.SOUTH: (0, -1),
+    Direction.EAST: (1, 0),
+    Direction.WEST: (-1, 0),
+}
 
 
 class PlayerType(Enum):
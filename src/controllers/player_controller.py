@@ -3,14 +3,34 @@ Player controller implementations using Strategy Pattern.
 Controllers handle decision-making for different player types.
 """
 
+import itertools
+import random
+import re
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Optional
 
+from config import MOVE_POLES
 from config.constants import GameConstants
-from config.enums import ActionType, DecisionType, Direction
+from config.enums import ActionType, DecisionType
+from llm import PromptTemplates
 from models import Action, Move
 from utils import Colors, safe_input
 
+# A direction mentioned as a whole word, by name or by letter. The first letter
+# of each name is its Direction value. Apostrophes count as part of a word so
+# that e.g. "LET'S" is not read as S.
+_DIRECTION_RE = re.compile(r"(?<![\w'])(NORTH|SOUTH|EAST|WEST|N|S|E|W)(?![\w'])")
+
+# Tuple of action names -> the bulleted action list shown to the LLM
+_ACTIONS_DESCRIPTIONS: dict[tuple[str, ...], str] = {}
+
+
+@lru_cache(maxsize=32)
+def _action_regex(action_names: tuple[str, ...]) -> re.Pattern:
+    """Compile (once per set of actions) a regex matching any of the action names."""
+    return re.compile(r"\b(" + "|".join(map(re.escape, action_names)) + r")\b")
+
 
 class PlayerController(ABC):
     """
@@ -75,8 +95,6 @@ class HumanController(PlayerController):
         ).upper()
 
         if direction not in available_directions:
-            import random
-
             fallback = random.choice(available_directions)
             print(Colors.player_info(f"Invalid direction. Defaulting to {fallback}"))
             return fallback
@@ -88,21 +106,22 @@ class HumanController(PlayerController):
         available_actions = context.get("available_actions", [])
         available_directions = context.get("available_directions", [])
 
-        print(Colors.player_info("\nWhat would you like to do?"))
-
-        options = []
         # Add MOVE option if directions available
-        if available_directions:
-            options.append(
-                ("MOVE", f"Move to another room ({', '.join(available_directions)})")
-            )
+        options = (
+            [("MOVE", f"Move to another room ({', '.join(available_directions)})")]
+            if available_directions
+            else []
+        )
 
         # Add other actions
-        for action in available_actions:
-            options.append((action.name, action.description))
+        options.extend(
+            (action.name, action.description) for action in available_actions
+        )
 
-        for i, (name, desc) in enumerate(options, 1):
-            print(Colors.player_info(f"{i}. {name}: {desc}"))
+        # Show the whole menu with a single write
+        menu = ["\nWhat would you like to do?"]
+        menu.extend(f"{i}. {name}: {desc}" for i, (name, desc) in enumerate(options, 1))
+        print("\n".join(Colors.player_info(line) for line in menu))
 
         choice = safe_input(
             "Choose an option (number, or /q to quit): ", Colors.input_prompt
@@ -139,17 +158,28 @@ class HumanController(PlayerController):
 class AIController(PlayerController):
     """Controller for AI players using LLM."""
 
-    def __init__(self, llm_module, player: Optional["Player"] = None):
+    def __init__(
+        self,
+        llm_module,
+        player: Optional["Player"] = None,
+        seed: Optional[int] = None,
+    ):
         """
         Initialize with LLM module.
 
         Args:
             llm_module: LLM module for decisions
             player: Optional reference to the player (for personality access)
+            seed: Optional seed for this NPC's random choices, for reproducible runs
         """
         self.llm_module = llm_module
-        self.last_direction: Optional[str] = None
+        self._rng = random.Random(seed)
+        self.last_direction: Optional[str] = player.last_direction if player else None
         self.player = player
+        # (personality type, has other players) -> move probability
+        self._move_probabilities: dict[tuple, float] = {}
+        # (personality type, action name) -> personality-flavoured player prompt
+        self._action_prompts: dict[tuple, str] = {}
 
     def _should_move(self, context: dict) -> bool:
         """
@@ -161,28 +191,33 @@ class AIController(PlayerController):
         Returns:
             True if NPC should move, False if should perform action
         """
-        import random
-
         # Default: use configured probability
         if not self.player or not self.player.personality:
-            return random.random() < GameConstants.NPC_MOVE_PROBABILITY
+            return self._rng.random() < GameConstants.NPC_MOVE_PROBABILITY
 
         # Get context
         current_room = context.get("current_room")
         if not current_room:
-            return random.random() < GameConstants.NPC_MOVE_PROBABILITY
+            return self._rng.random() < GameConstants.NPC_MOVE_PROBABILITY
 
-        # Use personality-based decision
+        # Use personality-based decision; the probability only depends on the
+        # personality and whether the NPC is alone, so it is computed once per pair
+        personality = self.player.personality
         has_other_players = len(current_room.players_inside) > 1
-        weights = self.player.personality.get_action_weights(has_other_players)
-
-        # Calculate probability
-        total_weight = sum(weights.values())
-        if total_weight == 0:
-            return random.random() < GameConstants.NPC_MOVE_PROBABILITY
+        key = (personality.personality_type, has_other_players)
+        move_probability = self._move_probabilities.get(key)
+        if move_probability is None:
+            weights = personality.get_action_weights(has_other_players)
+
+            # Calculate probability
+            total_weight = sum(weights.values())
+            if total_weight == 0:
+                move_probability = GameConstants.NPC_MOVE_PROBABILITY
+            else:
+                move_probability = weights["MOVE"] / total_weight
+            self._move_probabilities[key] = move_probability
 
-        move_probability = weights["MOVE"] / total_weight
-        return random.random() < move_probability
+        return self._rng.random() < move_probability
 
     def decide(self, decision_type: DecisionType, context: dict) -> str:
         """Get decision from AI using LLM."""
@@ -212,58 +247,44 @@ class AIController(PlayerController):
         current_room = context.get("current_room")
         player_memory = context.get("player_memory")
 
-        # Build context for LLM
-        room_info = f"Current room: {current_room.name}\n"
-        room_info += f"Description: {current_room.description}\n"
-        room_info += f"Available directions: {', '.join(available_directions)}\n"
+        notes = []
 
         # Add memory context if available
         if player_memory and hasattr(player_memory, "known_rooms"):
             visited_rooms = len(player_memory.known_rooms)
-            room_info += f"You have visited {visited_rooms} rooms so far.\n"
+            notes.append(f"You have visited {visited_rooms} rooms so far.")
 
         # Discourage backtracking
-        if self.last_direction:
-            try:
-                # Look up direction by value (N, S, E, W)
-                current_dir = Direction(self.last_direction)
-                opposite = current_dir.opposite.value  # Get opposite value (N, S, E, W)
-                if opposite in available_directions:
-                    room_info += f"\nNote: Going {opposite} would take you back where you came from. Consider exploring new directions when possible.\n"
-            except ValueError:
-                # Invalid direction, skip backtracking logic
-                pass
-
-        prompt = f"{room_info}\nChoose one direction to move: {', '.join(available_directions)}"
+        non_backtrack = available_directions
+        # Opposite value (N, S, E, W) of the last direction; None if invalid
+        opposite = MOVE_POLES.get(self.last_direction)
+        if opposite in available_directions:
+            notes.append(
+                f"Note: Going {opposite} would take you back where you came from. Consider exploring new directions when possible."
+            )
+            non_backtrack = [d for d in available_directions if d != opposite]
+
+        # Sorted so the same exits always read the same
+        prompt = PromptTemplates.NPC_MOVE_DECISION.substitute(
+            room_name=current_room.name,
+            room_description=current_room.description,
+            directions=", ".join(sorted(available_directions)),
+            notes="\n".join(notes),
+        )
 
         # Get LLM decision
         response = self.llm_module.get_response(prompt).strip().upper()
 
-        # Parse response
-        for direction in available_directions:
-            if direction in response:
+        # Parse response: take the first available direction mentioned
+        available = set(available_directions)
+        for match in _DIRECTION_RE.finditer(response):
+            direction = match.group(1)[0]
+            if direction in available:
                 self.last_direction = direction
                 return direction
 
-        # Fallback: prefer non-backtracking direction
-        if self.last_direction:
-            try:
-                import random
-
-                current_dir = Direction(self.last_direction)
-                opposite_value = current_dir.opposite.value
-                non_backtrack = [d for d in available_directions if d != opposite_value]
-                if non_backtrack:
-                    chosen = random.choice(non_backtrack)
-                    self.last_direction = chosen
-                    return chosen
-            except ValueError:
-                pass
-
-        # Ultimate fallback - pick random direction
-        import random
-
-        chosen = random.choice(available_directions)
+        # Fallback: prefer non-backtracking direction, or any if there is none
+        chosen = self._rng.choice(non_backtrack or available_directions)
         self.last_direction = chosen
         return chosen
 
@@ -272,34 +293,69 @@ class AIController(PlayerController):
         available_actions = context.get("available_actions", [])
         current_room = context.get("current_room")
 
-        actions_desc = "\n".join(
-            [f"- {a.name}: {a.description}" for a in available_actions]
+        # The action table is static, so each set of actions is described once
+        key = tuple(a.name for a in available_actions)
+        actions_desc = _ACTIONS_DESCRIPTIONS.get(key)
+        if actions_desc is None:
+            actions_desc = "\n".join(
+                [f"- {a.name}: {a.description}" for a in available_actions]
+            )
+            _ACTIONS_DESCRIPTIONS[key] = actions_desc
+
+        prompt = PromptTemplates.NPC_ACTION_DECISION.substitute(
+            actions=actions_desc,
+            room_name=current_room.name,
+            room_description=current_room.description,
         )
+        response = self.llm_module.get_response(prompt).strip().upper()
 
-        prompt = f"""You are in {current_room.name}.
-{current_room.description}
+        # Parse response: take the first action mentioned. Action names are
+        # ActionType values, already upper case like the response.
+        match = _action_regex(tuple(a.name for a in available_actions)).search(response)
+        if match:
+            return match.group(1)
 
-Available actions:
-{actions_desc}
+        # Fallback
+        return available_actions[0].name
 
-Choose one action by name."""
+    def _personality_action_prompt(self, action: Action) -> str:
+        """
+        Get the action's player prompt, prefixed with the NPC's personality.
 
-        response = self.llm_module.get_response(prompt).strip().upper()
+        Only depends on the personality and the action, so each combination is
+        built once and reused on later turns.
 
-        # Parse response
-        for action in available_actions:
-            if action.name.upper() in response:
-                return action.name
+        Args:
+            action: The action being performed
 
-        # Fallback
-        return available_actions[0].name
+        Returns:
+            The personality-flavoured player prompt
+        """
+        personality = self.player.personality if self.player else None
+        if not personality:
+            return action.player_prompt
+
+        key = (personality.personality_type, action.name)
+        enhanced_prompt = self._action_prompts.get(key)
+        if enhanced_prompt is None:
+            personality_desc = personality.get_personality_description()
+
+            # Add tone/intent based on action type
+            if action.name == "TALK":
+                tone = personality.get_talk_tone()
+                enhanced_prompt = f"{personality_desc} Speak in a {tone} manner. {action.player_prompt}"
+            elif action.name == "INTERACT":
+                intent = personality.get_interact_intent()
+                enhanced_prompt = f"{personality_desc} Your intent is {intent}. {action.player_prompt}"
+            else:
+                enhanced_prompt = f"{personality_desc} {action.player_prompt}"
+            self._action_prompts[key] = enhanced_prompt
+        return enhanced_prompt
 
     def provide_action_details(
         self, action: Action, current_room=None, players_map=None
     ) -> str:
         """Use LLM to provide action details with room and personality context."""
-        from llm import PromptTemplates
-
         # Get NPC name
         npc_name = self.player.name if self.player else "Character"
 
@@ -320,40 +376,24 @@ Choose one action by name."""
             if other_player_names:
                 other_players = ", ".join(other_player_names)
 
-        # Add personality context to the action prompt
-        enhanced_prompt = action.player_prompt
-        if self.player and self.player.personality:
-            personality = self.player.personality
-            personality_desc = personality.get_personality_description()
-
-            # Add tone/intent based on action type
-            if action.name == "TALK":
-                tone = personality.get_talk_tone()
-                enhanced_prompt = f"{personality_desc} Speak in a {tone} manner. {action.player_prompt}"
-            elif action.name == "INTERACT":
-                intent = personality.get_interact_intent()
-                enhanced_prompt = f"{personality_desc} Your intent is {intent}. {action.player_prompt}"
-            else:
-                enhanced_prompt = f"{personality_desc} {action.player_prompt}"
-
         # Use the concise NPC action prompt template with context
         prompt = PromptTemplates.NPC_ACTION_PROMPT.substitute(
             npc_name=npc_name,
             room_name=room_name,
             room_description=room_description,
             other_players=other_players,
-            player_prompt=enhanced_prompt,
+            player_prompt=self._personality_action_prompt(action),
         )
 
-        response = self.llm_module.get_response(prompt)
-
         # Trim response and ensure it's concise
-        response = response.strip()
+        response = self.llm_module.get_response(prompt).strip()
 
-        # If still too long, take first 2 sentences
-        sentences = response.split(".")
-        if len(sentences) > 2:
-            response = ". ".join(sentences[:2]) + "."
+        # If still too long, cut after the second sentence
+        first_end = response.find(".")
+        if first_end >= 0:
+            second_end = response.find(".", first_end + 1)
+            if second_end >= 0:
+                response = response[: second_end + 1]
 
         return response[: GameConstants.MAX_ACTION_DETAIL_LENGTH]
 
@@ -371,19 +411,15 @@ class MockController(PlayerController):
         """
         self.move_sequence = move_sequence or ["N"]
         self.action_sequence = action_sequence or ["OBSERVE"]
-        self.move_index = 0
-        self.action_index = 0
+        self._moves = itertools.cycle(self.move_sequence)
+        self._actions = itertools.cycle(self.action_sequence)
 
     def decide(self, decision_type: DecisionType, context: dict) -> str:
         """Return predetermined decision."""
         if decision_type == DecisionType.MOVE:
-            move = self.move_sequence[self.move_index % len(self.move_sequence)]
-            self.move_index += 1
-            return move
+            return next(self._moves)
         elif decision_type == DecisionType.ACT:
-            action = self.action_sequence[self.action_index % len(self.action_sequence)]
-            self.action_index += 1
-            return action
+            return next(self._actions)
         else:
             raise ValueError(f"Unknown decision type: {decision_type}")
 
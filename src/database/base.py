@@ -2,13 +2,45 @@
 Database base configuration and session management.
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session, sessionmaker
 
 # Base class for all database models
 Base = declarative_base()
 
+# One engine (and its connection pool) and session factory per database file
+_engines: dict[str, Engine] = {}
+_session_factories: dict[str, sessionmaker] = {}
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Use write-ahead logging so the frequent small game writes commit quickly."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+def _get_engine(db_path: str) -> Engine:
+    """
+    Get the engine for a database file, creating it on first use.
+
+    Args:
+        db_path: Path to the SQLite database file
+
+    Returns:
+        SQLAlchemy engine
+    """
+    engine = _engines.get(db_path)
+    if engine is None:
+        engine = create_engine(f"sqlite:///{db_path}", echo=False)
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+        _engines[db_path] = engine
+        _session_factories[db_path] = sessionmaker(bind=engine)
+    return engine
+
 
 def init_database(db_path: str = "game.db") -> Session:
     """
@@ -20,17 +52,11 @@ def init_database(db_path: str = "game.db") -> Session:
     Returns:
         SQLAlchemy session
     """
-    # Create engine
-    engine = create_engine(f"sqlite:///{db_path}", echo=False)
-
     # Create all tables
-    Base.metadata.create_all(engine)
-
-    # Create session factory
-    SessionFactory = sessionmaker(bind=engine)
+    Base.metadata.create_all(_get_engine(db_path))
 
     # Return a new session
-    return SessionFactory()
+    return _session_factories[db_path]()
 
 
 def get_session(db_path: str = "game.db") -> Session:
@@ -43,6 +69,5 @@ def get_session(db_path: str = "game.db") -> Session:
     Returns:
         SQLAlchemy session
     """
-    engine = create_engine(f"sqlite:///{db_path}", echo=False)
-    SessionFactory = sessionmaker(bind=engine)
-    return SessionFactory()
+    _get_engine(db_path)
+    return _session_factories[db_path]()
@@ -122,6 +122,7 @@ class DBPlayerHistory(Base):
     """Database model for player movement history."""
 
     __tablename__ = "player_history"
+    __table_args__ = (Index("idx_history_player_ts", "player_id", "timestamp"),)
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     player_id = Column(String, ForeignKey("players.id"), nullable=False)
@@ -169,6 +170,8 @@ class DBEventWitness(Base):
     """Database model for event witnesses (many-to-many)."""
 
     __tablename__ = "event_witnesses"
+    # The primary key leads with event_id; witnessed events are looked up by player
+    __table_args__ = (Index("idx_witnesses_player", "player_id"),)
 
     event_id = Column(Integer, ForeignKey("game_events.id"), primary_key=True)
     player_id = Column(String, ForeignKey("players.id"), primary_key=True)
@@ -2,7 +2,22 @@
 LLM package for language model interactions.
 """
 
+from .llm_cache import (
+    CachingLLMModule,
+    LLMResponseCache,
+    default_cache,
+    world_cache,
+)
 from .llm_module import LLMModule, create_llm_module
 from .prompts import PromptBuilder, PromptTemplates
 
-__all__ = ["LLMModule", "create_llm_module", "PromptTemplates", "PromptBuilder"]
+__all__ = [
+    "LLMModule",
+    "CachingLLMModule",
+    "LLMResponseCache",
+    "default_cache",
+    "world_cache",
+    "create_llm_module",
+    "PromptTemplates",
+    "PromptBuilder",
+]
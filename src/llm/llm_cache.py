@@ -0,0 +1,147 @@
+"""
+Exact-match response cache for LLM calls.
+
+Room and memory prompts are built from fixed templates, so identical prompts
+recur often (e.g. re-describing the same adjacent room). Caching them skips
+the network round-trip entirely.
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Lowercase, strip and collapse whitespace so trivially different prompts share a key."""
+    return _WHITESPACE_RE.sub(" ", prompt.strip().lower())
+
+
+class LLMResponseCache:
+    """
+    Thread-safe LRU cache of LLM responses keyed by a SHA-256 of the prompt.
+
+    The key also covers the system prompt, since the same user prompt sent to
+    a different persona must not share a response.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        exclude_patterns: Iterable[str] = (),
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of responses kept before evicting the
+                         least recently used one
+            exclude_patterns: Regex patterns; matching prompts are never cached
+                              (e.g. time-dependent prompts)
+        """
+        self.max_entries = max_entries
+        self.exclude_patterns = [re.compile(p) for p in exclude_patterns]
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(system_prompt: str, prompt: str) -> str:
+        """Build the cache key for a system prompt / user prompt pair."""
+        payload = f"{normalize_prompt(system_prompt)}\x00{normalize_prompt(prompt)}"
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def is_cacheable(self, prompt: str) -> bool:
+        """Check whether a prompt is allowed to be cached."""
+        return not any(p.search(prompt) for p in self.exclude_patterns)
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached response, marking it as recently used."""
+        with self._lock:
+            response = self._entries.get(key)
+            if response is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return response
+
+    def put(self, key: str, response: str) -> None:
+        """Store a response, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared by every module so that re-created modules (e.g. after a player's
+# self-description changes) still benefit from earlier responses.
+default_cache = LLMResponseCache()
+
+# World generation gets its own cache, so the many memory prompts of a long
+# session cannot evict its room descriptions
+world_cache = LLMResponseCache()
+
+
+class CachingLLMModule:
+    """
+    Wraps an LLMModule and serves repeated prompts from an LLMResponseCache.
+
+    Exposes the same interface as LLMModule; attributes not defined here
+    (system_prompt, provider, ...) are delegated to the wrapped module.
+    """
+
+    def __init__(self, module, cache: Optional[LLMResponseCache] = None):
+        """
+        Initialize the caching wrapper.
+
+        Args:
+            module: The LLMModule to wrap
+            cache: Cache to use; defaults to the shared default_cache
+        """
+        self.module = module
+        self.cache = cache if cache is not None else default_cache
+
+    def __getattr__(self, name):
+        return getattr(self.module, name)
+
+    def get_response(self, prompt: str) -> str:
+        """Get a response from the cache, falling back to the wrapped module."""
+        if not self.cache.is_cacheable(prompt):
+            return self.module.get_response(prompt)
+
+        key = self.cache.make_key(self.module.system_prompt, prompt)
+        response = self.cache.get(key)
+        if response is None:
+            response = self.module.get_response(prompt)
+            self.cache.put(key, response)
+        return response
+
+    def get_validated_response(
+        self, prompt: str, max_words: int = None, min_words: int = 1
+    ) -> str:
+        """Get a validated response (see LLMModule.get_validated_response)."""
+        from .llm_module import LLMModule
+
+        return LLMModule.get_validated_response(self, prompt, max_words, min_words)
+
+    def get_response_with_fallback(
+        self, prompt: str, fallback: str = "Unable to generate response"
+    ) -> str:
+        """Get a response with a fallback (see LLMModule.get_response_with_fallback)."""
+        from .llm_module import LLMModule
+
+        return LLMModule.get_response_with_fallback(self, prompt, fallback)
@@ -2,6 +2,7 @@ import json
 import logging
 import os
 import time
+from typing import Optional
 
 import google.generativeai as genai
 import requests
@@ -14,6 +15,8 @@ from tenacity import (
     wait_exponential,
 )
 
+from .llm_cache import CachingLLMModule, LLMResponseCache
+
 load_dotenv()
 
 # Configure debug logging for LLM calls
@@ -51,6 +54,9 @@ OLLAMA_MODEL_NAME = os.environ.get("OLLAMA_MODEL_NAME", "qwen3:8b")
 # Determine the LLM provider
 LLM_PROVIDER = os.environ.get("LLM_PROVIDER", "gemini").lower()
 
+# Serve repeated prompts from an in-memory response cache
+LLM_CACHE = os.environ.get("LLM_CACHE", "true").lower() == "true"
+
 
 class LLMModule:
     """
@@ -264,19 +270,29 @@ class LLMModule:
             return fallback
 
 
-def create_llm_module(system_prompt: str, provider: str = LLM_PROVIDER) -> LLMModule:
+def create_llm_module(
+    system_prompt: str,
+    provider: str = LLM_PROVIDER,
+    cache: Optional[LLMResponseCache | bool] = None,
+) -> LLMModule:
     """
     Factory function to create a new LLMModule instance.
 
     Args:
         system_prompt: The system-level instruction for the model.
         provider: The LLM provider to use ("gemini" or "ollama").
+        cache: Response cache to use; defaults to the shared default_cache.
+            Pass False for replies that must not repeat (e.g. NPC decisions).
 
     Returns:
-        An instance of the LLMModule class.
+        An instance of the LLMModule class, wrapped in a CachingLLMModule
+        unless caching is disabled (cache=False or LLM_CACHE off).
     """
     # The LLMModule constructor will handle API key/URL based on the provider
-    return LLMModule(system_prompt, api_key=os.environ.get("GOOGLE_API_KEY", ""))
+    module = LLMModule(system_prompt, api_key=os.environ.get("GOOGLE_API_KEY", ""))
+    if LLM_CACHE and cache is not False:
+        return CachingLLMModule(module, cache)
+    return module
 
 
 # --- Example Usage ---
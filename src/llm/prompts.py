@@ -127,6 +127,27 @@ Bad examples (TOO VERBOSE):
 Your response (1-2 sentences only):"""
     )
 
+    # NPC decision prompts. The fixed instructions (and the action list, which
+    # only has a couple of variants) come first, so requests share a prefix.
+    NPC_MOVE_DECISION = Template(
+        """Choose one direction to move. Answer with the direction only.
+
+Current room: ${room_name}
+Description: ${room_description}
+Available directions: ${directions}
+${notes}"""
+    )
+
+    NPC_ACTION_DECISION = Template(
+        """Choose one action by name. Answer with the action name only.
+
+Available actions:
+${actions}
+
+You are in ${room_name}.
+${room_description}"""
+    )
+
     # System prompts - EMPHASIZE CONCISENESS
     PLAYER_SYSTEM_PROMPT = """You are an adventurer in a text-based D&D game. 
 
@@ -150,10 +171,11 @@ Think D&D session notes, not novel writing.
 """
 
     # World generation prompts (used by WorldGenerator) - CONCISE D&D style
+    # Static instructions come first and the room-specific details last, so
+    # consecutive requests share the longest possible prompt prefix (which the
+    # provider can reuse between calls).
     WORLD_GEN_ROOM_DESCRIPTION = Template(
-        """Describe this ${word_count}-word room for a D&D game:
-Room: ${room_name}
-Exits: ${room_paths}
+        """Describe a room for a D&D game in ${word_count} words max.
 
 IMPORTANT: Be concise and atmospheric. Focus on:
 1. What you see/hear/smell (sensory details)
@@ -166,20 +188,40 @@ Good example (40 words):
 Bad example (TOO VERBOSE/FLOWERY):
 "As you enter this magnificent chamber, you are immediately struck by..."
 
+Room: ${room_name}
+Exits: ${room_paths}
+
 Your description (${word_count} words max):"""
     )
 
     WORLD_GEN_ROOM_CONNECTION = Template(
-        """Room ${room_name} now connects ${direction} to ${new_room_name}.
+        """A room has a new connection. Update its description briefly to mention the new connection. Keep it concise (add 1 sentence max).
+
+Room ${room_name} now connects ${direction} to ${new_room_name}.
 
 Current description:
 ${current_description}
 
-Update briefly to mention the new ${direction} connection. Keep it concise (add 1 sentence max).
-
 Updated description:"""
     )
 
+    WORLD_GEN_ROOM_CONNECTIONS_BATCH = Template(
+        """Some rooms now connect to a newly created room. Update each description briefly to mention its new connection. Keep it concise (add 1 sentence max per room).
+
+Respond with ONLY a JSON object mapping each room_id to its updated description, e.g.
+{"room-id-1": "Updated description...", "room-id-2": "Updated description..."}
+
+New room: ${new_room_name}
+
+${connections}"""
+    )
+
+    WORLD_GEN_ROOM_CONNECTION_ENTRY = Template(
+        """room_id: ${room_id}
+Room: ${room_name} (connects ${direction})
+Current description: ${current_description}"""
+    )
+
 
 class PromptBuilder:
     """Helper class for building complex prompts."""
@@ -5,7 +5,7 @@ Action and Move dataclasses for game mechanics.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Move:
     """Represents a movement direction in the game."""
 
@@ -14,7 +14,7 @@ class Move:
     pole: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Action:
     """Represents an action a player can perform."""
 
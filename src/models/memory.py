@@ -8,7 +8,7 @@ from typing import Optional
 from .events import GameEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerEntry:
     """Entry in a player's memory about another player."""
 
@@ -24,7 +24,7 @@ class PlayerEntry:
         self.description = new_description
 
 
-@dataclass
+@dataclass(slots=True)
 class RoomEntry:
     """Entry in a player's memory about a room."""
 
@@ -124,32 +124,37 @@ class NPCPersonality:
 
     def get_personality_description(self) -> str:
         """Get a description of this personality for LLM context."""
-        descriptions = {
-            PersonalityType.EXPLORER: "You are an explorer who loves discovering new places. You prefer to keep moving and don't like small talk.",
-            PersonalityType.HOMEBODY: "You are a homebody who likes familiar places. You stay in your comfort zone and prefer solitude.",
-            PersonalityType.HOSTILE: "You are hostile and aggressive. You interact with people and objects to cause trouble, steal, or destroy.",
-            PersonalityType.HELPFUL: "You are helpful and friendly. You love talking to people and helping them out.",
-        }
-        return descriptions.get(
+        return _DESCRIPTIONS.get(
             self.personality_type, "You are an adventurer in this world."
         )
 
     def get_talk_tone(self) -> str:
         """Get the tone for TALK actions."""
-        tones = {
-            PersonalityType.EXPLORER: "brief and distracted",
-            PersonalityType.HOMEBODY: "quiet and withdrawn",  # Shouldn't happen
-            PersonalityType.HOSTILE: "threatening and aggressive",
-            PersonalityType.HELPFUL: "friendly and warm",
-        }
-        return tones.get(self.personality_type, "neutral")
+        return _TALK_TONES.get(self.personality_type, "neutral")
 
     def get_interact_intent(self) -> str:
         """Get the intent for INTERACT actions."""
-        intents = {
-            PersonalityType.EXPLORER: "curious examination",
-            PersonalityType.HOMEBODY: "cautious observation",  # Shouldn't happen
-            PersonalityType.HOSTILE: "destructive or thieving",
-            PersonalityType.HELPFUL: "trying to help or fix",
-        }
-        return intents.get(self.personality_type, "investigation")
+        return _INTERACT_INTENTS.get(self.personality_type, "investigation")
+
+
+# Per-type prompt fragments, built once at import
+_DESCRIPTIONS = {
+    PersonalityType.EXPLORER: "You are an explorer who loves discovering new places. You prefer to keep moving and don't like small talk.",
+    PersonalityType.HOMEBODY: "You are a homebody who likes familiar places. You stay in your comfort zone and prefer solitude.",
+    PersonalityType.HOSTILE: "You are hostile and aggressive. You interact with people and objects to cause trouble, steal, or destroy.",
+    PersonalityType.HELPFUL: "You are helpful and friendly. You love talking to people and helping them out.",
+}
+
+_TALK_TONES = {
+    PersonalityType.EXPLORER: "brief and distracted",
+    PersonalityType.HOMEBODY: "quiet and withdrawn",  # Shouldn't happen
+    PersonalityType.HOSTILE: "threatening and aggressive",
+    PersonalityType.HELPFUL: "friendly and warm",
+}
+
+_INTERACT_INTENTS = {
+    PersonalityType.EXPLORER: "curious examination",
+    PersonalityType.HOMEBODY: "cautious observation",  # Shouldn't happen
+    PersonalityType.HOSTILE: "destructive or thieving",
+    PersonalityType.HELPFUL: "trying to help or fix",
+}
@@ -2,12 +2,14 @@
 Player class for game entities.
 """
 
+import random
 from typing import TYPE_CHECKING, Optional
 from uuid import uuid4
 
 from config.constants import GameConstants
 from config.enums import PlayerType
 from llm import LLMModule, create_llm_module
+from logger import logger
 
 from .events import GameEvent
 from .memory import Memory, PlayerEntry, RoomEntry
@@ -23,6 +25,19 @@ class Player:
     Uses the Strategy Pattern via PlayerController for decision-making.
     """
 
+    __slots__ = (
+        "id",
+        "name",
+        "player_type",
+        "room_id",
+        "last_direction",
+        "memory",
+        "controller",
+        "personality",
+        "llm_module",
+        "description",
+    )
+
     DEFAULT_LLM_SYSTEM_PROMPT = "You are an adventurer in a text-based exploration game. Make decisions based on your surroundings and history."
 
     def __init__(
@@ -33,6 +48,7 @@ class Player:
         player_type: PlayerType = PlayerType.HUMAN,
         llm_module: Optional[LLMModule] = None,
         personality: Optional[NPCPersonality] = None,
+        description: Optional[str] = None,
     ):
         """
         Initialize a player.
@@ -44,6 +60,7 @@ class Player:
             player_type: Type of player (HUMAN or NPC)
             llm_module: Optional LLM module for testing
             personality: Optional NPC personality (auto-generated if NPC and not provided)
+            description: Optional existing self-description (generated via LLM if not provided)
         """
         if not name:
             raise ValueError("Player name cannot be empty")
@@ -54,7 +71,7 @@ class Player:
         self.name: str = name
         self.player_type: PlayerType = player_type
         self.room_id: str = room_id
-        self.history: list[tuple[str, str]] = []
+        self.last_direction: Optional[str] = None
         self.memory: Memory = Memory()
         self.controller = controller
 
@@ -71,7 +88,7 @@ class Player:
             self.DEFAULT_LLM_SYSTEM_PROMPT
         )
 
-        self.description: str = self.llm_module.get_response(
+        self.description: str = description or self.llm_module.get_response(
             f"Provide a {GameConstants.DEFAULT_DESCRIPTION_WORDS}-word brief description of your character named {self.name}."
         )
 
@@ -80,8 +97,6 @@ class Player:
 
     def _generate_random_personality(self) -> NPCPersonality:
         """Generate a random personality for an NPC."""
-        import random
-
         personality_type = random.choice(list(PersonalityType))
         return NPCPersonality(personality_type=personality_type)
 
@@ -99,32 +114,37 @@ class Player:
             self.DEFAULT_LLM_SYSTEM_PROMPT + self.describe_self()
         )
 
-    def move(self, from_room_id: str, action_taken: str, to_room_id: str) -> None:
+    def move(self, action_taken: str, to_room_id: str) -> None:
         """
         Move the player to a new room.
 
+        The full movement history is persisted by PlayerRepository.add_history_entry;
+        only the last direction is kept in memory.
+
         Args:
-            from_room_id: The room ID the player is leaving
             action_taken: The action/direction taken
             to_room_id: The room ID the player is entering
 
         Raises:
-            ValueError: If any room ID is empty or action is invalid
+            ValueError: If the room ID is empty or action is invalid
         """
-        if not from_room_id:
-            raise ValueError("from_room_id cannot be empty")
         if not to_room_id:
             raise ValueError("to_room_id cannot be empty")
         if not action_taken:
             raise ValueError("action_taken cannot be empty")
 
-        self.history.append((from_room_id, action_taken))
+        self.last_direction = action_taken
         self.room_id = to_room_id
 
     def observe(self, current_room, players_map):
         """Update player's memory about the current room and players in it."""
-        print(
-            f"Other players in the room: {[players_map[pid].name for pid in current_room.players_inside if pid != self.id]}"
+        logger.opt(lazy=True).debug(
+            "Other players in the room: {}",
+            lambda: [
+                players_map[pid].name
+                for pid in current_room.players_inside
+                if pid != self.id
+            ],
         )
         # Update player's memory about the people in the room
         for pid in current_room.players_inside:
@@ -217,8 +237,12 @@ class Player:
 
         new_description = self.llm_module.get_response(synthesize_prompt)
         self.memory.known_players[player_name].update_description(new_description)
-        print(f"Player {self.name} updated memory of player {player_name}.")
-        print(f"New description: {new_description}")
+        logger.debug(
+            "Player {} updated memory of player {}.\nNew description: {}",
+            self.name,
+            player_name,
+            new_description,
+        )
 
     def synthesize_room_memory(self, room_id: str):
         """Update mental description of a room based on recent observations."""
@@ -260,5 +284,9 @@ class Player:
 
         new_description = self.llm_module.get_response(synthesize_prompt)
         self.memory.known_rooms[room_id].update_description(new_description)
-        print(f"Player {self.name} updated memory of room {room_id}.")
-        print(f"New description: {new_description}")
+        logger.debug(
+            "Player {} updated memory of room {}.\nNew description: {}",
+            self.name,
+            room_id,
+            new_description,
+        )
@@ -3,17 +3,32 @@ Room class and related dataclasses.
 """
 
 from dataclasses import dataclass
+from typing import Optional
 
 import fictional_names
 import fictional_names.name_generator
 from FantasyNameGenerator.Stores import Town
 
+from logger import logger
+
 
 class Room:
     """Represents a room in the game world."""
 
-    def __init__(self, coords: tuple[int, int], description: str = ""):
-        self.id, self.name = self.new_details()
+    __slots__ = ("id", "name", "coords", "paths", "players_inside", "description")
+
+    def __init__(
+        self,
+        coords: tuple[int, int],
+        description: str = "",
+        room_id: Optional[str] = None,
+        name: Optional[str] = None,
+    ):
+        # Existing rooms keep their identity; only new rooms get generated details
+        if room_id is None or name is None:
+            self.id, self.name = self.new_details()
+        else:
+            self.id, self.name = room_id, name
         self.coords = coords
         self.paths: dict[str, str] = {}  # {"N":room_id, "S":room_id}
         self.players_inside: set[str] = set()  # {player_id}
@@ -39,7 +54,7 @@ class Room:
     def update_description(self, new_description: str) -> None:
         """Update the room's description."""
         self.description = new_description
-        print(f"Room {self.name} updated: {self.description}.")
+        logger.debug("Room {} updated: {}.", self.name, self.description)
 
 
 @dataclass
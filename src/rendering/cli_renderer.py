@@ -21,6 +21,7 @@ class CLIRenderer:
         room_map: dict[tuple[int, int], str],
         current_player_id: Optional[str] = None,
         players_map: Optional[dict] = None,
+        bounds: Optional[tuple[int, int, int, int]] = None,
     ) -> None:
         """
         Draw the CLI map.
@@ -30,51 +31,59 @@ class CLIRenderer:
             room_map: Dictionary of coords -> room_id
             current_player_id: Optional ID of the current player to highlight
             players_map: Optional dictionary of player_id -> Player for showing names
+            bounds: Optional precomputed (min_x, max_x, min_y, max_y) of room_map;
+                    computed by scanning room_map if not given
         """
         if not room_map:
             print("The map is empty.")
             return
 
-        coords = list(room_map.keys())
-        min_x, max_x = min(c[0] for c in coords), max(c[0] for c in coords)
-        min_y, max_y = min(c[1] for c in coords), max(c[1] for c in coords)
+        if bounds is None:
+            coords = room_map.keys()
+            bounds = (
+                min(c[0] for c in coords),
+                max(c[0] for c in coords),
+                min(c[1] for c in coords),
+                max(c[1] for c in coords),
+            )
+        min_x, max_x, min_y, max_y = bounds
 
-        # Use dict with .get() instead of defaultdict
-        grid: dict[tuple[int, int], str] = {}
+        w, h = self.cell_width, self.cell_height
+        grid_w = (max_x - min_x + 1) * (w - 1) + 1
+        grid_h = (max_y - min_y + 1) * (h - 1) + 1
+
+        # Row buffers written with slice assignment, instead of one dict entry per cell
+        rows = [[" "] * grid_w for _ in range(grid_h)]
+        horizontal_edge = ["+"] + ["-"] * (w - 2) + ["+"]
 
         for (x, y), room_id in room_map.items():
             room = rooms.get(room_id)
             if not room:
                 continue
 
-            cx = (x - min_x) * (self.cell_width - 1)
-            cy = (max_y - y) * (self.cell_height - 1)
+            cx = (x - min_x) * (w - 1)
+            cy = (max_y - y) * (h - 1)
 
             # Draw room box
-            for i in range(self.cell_width):
-                grid[cx + i, cy] = "-"
-                grid[cx + i, cy + self.cell_height - 1] = "-"
-            for i in range(self.cell_height):
-                grid[cx, cy + i] = "|"
-                grid[cx + self.cell_width - 1, cy + i] = "|"
-            grid[cx, cy] = "+"
-            grid[cx + self.cell_width - 1, cy] = "+"
-            grid[cx, cy + self.cell_height - 1] = "+"
-            grid[cx + self.cell_width - 1, cy + self.cell_height - 1] = "+"
+            rows[cy][cx : cx + w] = horizontal_edge
+            rows[cy + h - 1][cx : cx + w] = horizontal_edge
+            for r in range(cy + 1, cy + h - 1):
+                rows[r][cx] = "|"
+                rows[r][cx + w - 1] = "|"
 
             # Draw connections (just gaps, no | or -)
             if "N" in room.paths:
-                grid[cx + self.cell_width // 2, cy] = " "
+                rows[cy][cx + w // 2] = " "
             if "S" in room.paths:
-                grid[cx + self.cell_width // 2, cy + self.cell_height - 1] = " "
+                rows[cy + h - 1][cx + w // 2] = " "
             if "W" in room.paths:
-                grid[cx, cy + self.cell_height // 2] = " "
+                rows[cy + h // 2][cx] = " "
             if "E" in room.paths:
-                grid[cx + self.cell_width - 1, cy + self.cell_height // 2] = " "
+                rows[cy + h // 2][cx + w - 1] = " "
 
             # Draw players (AFTER connections so they don't get overwritten)
             player_chars = []
-            for pid in sorted(list(room.players_inside)):
+            for pid in sorted(room.players_inside):
                 if pid == current_player_id:
                     player_chars.append("@")  # Current player
                 else:
@@ -85,18 +94,14 @@ class CLIRenderer:
                     else:
                         player_chars.append("?")  # Unknown player
 
-            player_str = "".join(player_chars)
             # Place player string in the middle of the room
-            start_pos = (self.cell_width - len(player_str)) // 2
-            for i, char in enumerate(player_str):
-                grid[cx + start_pos + i, cy + (self.cell_height // 2)] = char
-
-        grid_w = (max_x - min_x + 1) * (self.cell_width - 1) + 1
-        grid_h = (max_y - min_y + 1) * (self.cell_height - 1) + 1
+            start_pos = cx + (w - len(player_chars)) // 2
+            middle_row = rows[cy + h // 2]
+            for i, char in enumerate(player_chars, start_pos):
+                if 0 <= i < grid_w:
+                    middle_row[i] = char
 
         header = " MAP (@: You, Letters: NPCs) "
         print("\n" + f"{header:=^{grid_w}}")
-        for r in range(grid_h):
-            line = "".join([grid.get((c, r), " ") for c in range(grid_w)])
-            print(line)
+        print("\n".join("".join(row) for row in rows))
         print("=" * grid_w + "\n")
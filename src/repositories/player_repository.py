@@ -48,7 +48,6 @@ class PlayerRepository:
             .options(
                 joinedload(DBPlayer.known_players),
                 joinedload(DBPlayer.known_rooms),
-                joinedload(DBPlayer.history),
             )
             .filter_by(id=player_id, world_id=self.world_id)
             .first()
@@ -74,7 +73,6 @@ class PlayerRepository:
             .options(
                 joinedload(DBPlayer.known_players),
                 joinedload(DBPlayer.known_rooms),
-                joinedload(DBPlayer.history),
             )
             .filter_by(name=name, world_id=self.world_id)
             .first()
@@ -272,15 +270,26 @@ class PlayerRepository:
             controller=None,  # Set below
             player_type=player_type,
             personality=personality,
+            description=db_player.description,
         )
         player.id = db_player.id
-        player.description = db_player.description
+
+        # Restore the last direction moved (the full history stays in the database)
+        last_move = (
+            self.session.query(DBPlayerHistory.action)
+            .filter_by(player_id=db_player.id)
+            .order_by(DBPlayerHistory.timestamp.desc())
+            .first()
+        )
+        player.last_direction = last_move.action if last_move else None
 
         # Create appropriate controller with player reference
         if player_type == PlayerType.HUMAN:
             controller = HumanController()
         elif player_type == PlayerType.NPC:
-            llm_module = create_llm_module(Player.DEFAULT_LLM_SYSTEM_PROMPT)
+            llm_module = create_llm_module(
+                Player.DEFAULT_LLM_SYSTEM_PROMPT, cache=False
+            )
             controller = AIController(llm_module, player=player)
         else:
             raise ValueError(f"Unknown player type: {player_type}")
@@ -306,20 +315,6 @@ class PlayerRepository:
             )
             player.memory.known_rooms[db_known_room.room_id] = room_entry
 
-        # Restore history (limited to recent entries to avoid memory issues)
-        recent_history = (
-            self.session.query(DBPlayerHistory)
-            .filter_by(player_id=db_player.id)
-            .order_by(DBPlayerHistory.timestamp.desc())
-            .limit(50)
-            .all()
-        )
-        player.history = [
-            f"{h.action} from {h.from_room_id}"
-            + (f" to {h.to_room_id}" if h.to_room_id else "")
-            for h in reversed(recent_history)
-        ]
-
         return player
 
     def _to_db(self, player: Player) -> DBPlayer:
@@ -165,10 +165,12 @@ class RoomRepository:
         Returns:
             Domain room model
         """
-        room = Room(coords=(db_room.coords_x, db_room.coords_y))
-        room.id = db_room.id
-        room.name = db_room.name
-        room.description = db_room.description
+        room = Room(
+            coords=(db_room.coords_x, db_room.coords_y),
+            description=db_room.description,
+            room_id=db_room.id,
+            name=db_room.name,
+        )
 
         # Convert paths
         room.paths = {path.direction: path.connected_room_id for path in db_room.paths}
@@ -2,6 +2,8 @@
 Event bus for distributing events to witnesses using database persistence.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from sqlalchemy.orm import Session
 
 from models import GameEvent, Player
@@ -26,6 +28,10 @@ class EventBus:
         self.world_id = world_id
         self.event_repo = EventRepository(session, world_id)
 
+        # Witnesses only update their own memory, so their (LLM-bound) memory
+        # syntheses are independent and run concurrently on these workers
+        self._witness_executor = ThreadPoolExecutor(thread_name_prefix="event-witness")
+
     def distribute_event(
         self, event: GameEvent, witness_ids: list[str], players_map: dict[str, Player]
     ) -> None:
@@ -41,10 +47,19 @@ class EventBus:
         self.event_repo.add(event, witness_ids)
 
         # Distribute to witnesses in memory
-        for witness_id in witness_ids:
-            if witness_id in players_map:
-                witness = players_map[witness_id]
-                witness.witness(event, players_map)
+        witnesses = [players_map[wid] for wid in witness_ids if wid in players_map]
+        if len(witnesses) > 1:
+            list(
+                self._witness_executor.map(
+                    lambda witness: witness.witness(event, players_map), witnesses
+                )
+            )
+        elif witnesses:
+            witnesses[0].witness(event, players_map)
+
+    def close(self) -> None:
+        """Stop the witness worker threads."""
+        self._witness_executor.shutdown()
 
     def notify_player_left_room(
         self,
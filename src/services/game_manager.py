@@ -2,7 +2,6 @@
 Game manager - orchestrates all game services and manages players using database persistence.
 """
 
-import random
 from typing import Optional
 
 from sqlalchemy.orm import Session
@@ -10,6 +9,7 @@ from sqlalchemy.orm import Session
 from config.enums import PlayerType
 from controllers import AIController, HumanController
 from llm import create_llm_module
+from logger import logger
 from models import Player
 from rendering import CLIRenderer
 from repositories import PlayerRepository
@@ -84,32 +84,32 @@ class GameManager:
         if not player_name:
             raise ValueError("Player name cannot be empty")
 
-        print(f"Creating player: {player_name}")
+        logger.debug("Creating player: {}", player_name)
 
         # Check if player already exists
         if self.player_repo.name_exists(player_name):
             print(f"Player with name {player_name} already exists.")
             return None
 
-        # Get available room IDs
-        room_ids = self.world_generator.get_all_room_ids()
-        if not room_ids:
+        # Random starting room
+        starting_room_id = self.world_generator.get_random_room_id()
+        if not starting_room_id:
             raise ValueError("Cannot create player: No rooms exist in the world")
 
-        # Random starting room
-        starting_room_id = random.choice(room_ids)
         starting_room = self.world_generator.get_room(starting_room_id)
 
         if not starting_room:
             raise ValueError(f"Starting room {starting_room_id} not found")
 
-        print(f"Player {player_name} starting in room {starting_room.name}")
+        logger.debug("Player {} starting in room {}", player_name, starting_room.name)
 
         # Create appropriate controller
         if player_type == PlayerType.HUMAN:
             controller = HumanController()
         elif player_type == PlayerType.NPC:
-            npc_llm = create_llm_module(Player.DEFAULT_LLM_SYSTEM_PROMPT)
+            # Uncached: every NPC shares this system prompt, and cached replies
+            # would give NPCs in the same situation the same choices and lines
+            npc_llm = create_llm_module(Player.DEFAULT_LLM_SYSTEM_PROMPT, cache=False)
             controller = AIController(npc_llm)
         else:
             raise ValueError(f"Unknown player type: {player_type}")
@@ -122,7 +122,9 @@ class GameManager:
             player_type=player_type,
         )
 
-        print(f"Created player {player_name}, description: {player.description}")
+        logger.debug(
+            "Created player {}, description: {}", player_name, player.description
+        )
 
         # Save player to database
         self.player_repo.add(player)
@@ -130,7 +132,7 @@ class GameManager:
         # Update room occupancy (in memory only for now)
         starting_room.players_inside.add(player.id)
 
-        print(f"Player {player_name} created with ID {player.id}.")
+        logger.debug("Player {} created with ID {}.", player_name, player.id)
         return player
 
     def run(self) -> None:
@@ -143,7 +145,12 @@ class GameManager:
         players_map = self.player_repo.get_all()
 
         # Run game loop (room occupancy populated dynamically each turn)
-        self.turn_system.run_game_loop(players_map)
+        try:
+            self.turn_system.run_game_loop(players_map)
+        finally:
+            self.world_generator.close()
+            self.event_bus.close()
+            self.turn_system.close()
 
     def get_players(self) -> dict[str, Player]:
         """Get all players from database."""
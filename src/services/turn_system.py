@@ -2,16 +2,21 @@
 Turn system for managing player turns and actions.
 """
 
+import random
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
-from config import GameConfigs
-from config.enums import ActionType, DecisionType
+from config import MOVE_POLES, MOVE_TRANSLATIONS, GameConfigs
+from config.constants import GameConstants
+from config.enums import ActionType, DecisionType, PlayerType
 from llm import PromptTemplates
+from logger import logger
 from models import Player, Room
 from rendering import CLIRenderer
 from repositories import PlayerRepository
 from services.event_bus import EventBus
 from services.world_generator import WorldGenerator
+from utils import Colors
 
 
 class TurnSystem:
@@ -41,6 +46,13 @@ class TurnSystem:
         self.renderer = renderer
         self.player_repo = player_repo
 
+        # NPC decisions of a round are prefetched concurrently on these workers
+        self._prefetch_executor = ThreadPoolExecutor(thread_name_prefix="npc-prefetch")
+
+    def close(self) -> None:
+        """Stop the prefetch worker threads."""
+        self._prefetch_executor.shutdown()
+
     def _populate_room_occupancy(
         self, rooms_dict: dict[str, Room], players_map: dict[str, Player]
     ) -> None:
@@ -116,34 +128,39 @@ class TurnSystem:
 
         Time Complexity: O(1)
         """
-        print(f"Processing move for player {player.id}: {direction}")
+        logger.debug("Processing move for player {}: {}", player.id, direction)
 
         current_room = self.world_generator.get_room(player.room_id)
         if not current_room:
             print(f"Error: Current room {player.room_id} not found")
             return False
 
-        print(f"Player {player.name} is in room {current_room.name}")
+        logger.debug("Player {} is in room {}", player.name, current_room.name)
 
-        # Calculate next coordinates
-        next_coords = self.world_generator._translate(current_room.coords, direction)
+        # Follow the room's exit directly if it already leads somewhere,
+        # otherwise look up (or create) the room at the next coordinates
+        next_room_id = current_room.paths.get(direction)
+        next_room = (
+            self.world_generator.get_room(next_room_id) if next_room_id else None
+        )
+        if not next_room:
+            x, y = current_room.coords
+            dx, dy = MOVE_TRANSLATIONS[direction]
+            next_coords = (x + dx, y + dy)
+            next_room = self.world_generator.get_room_at_coords(next_coords)
 
-        # Check if room exists, create if not
-        next_room = self.world_generator.get_room_at_coords(next_coords)
         if not next_room:
             # Create new room
-            from_direction = GameConfigs._moves[direction].pole
+            from_direction = MOVE_POLES[direction]
             next_room = self.world_generator.create_room(
                 next_coords, current_room, from_direction
             )
         else:
-            print(f"Moving to existing room {next_room.name}")
+            logger.debug("Moving to existing room {}", next_room.name)
 
-        # Get witnesses BEFORE player moves (from current player locations)
+        # Get witnesses BEFORE player moves (from current room occupancy)
         witnesses_before = [
-            pid
-            for pid, p in players_map.items()
-            if p.room_id == current_room.id and pid != player.id
+            pid for pid in current_room.players_inside if pid != player.id
         ]
 
         # Notify witnesses player is leaving
@@ -154,8 +171,10 @@ class TurnSystem:
             players_map=players_map,
         )
 
-        # Update player location
-        player.move(current_room.id, direction, next_room.id)
+        # Update player location and room occupancy
+        player.move(direction, next_room.id)
+        current_room.players_inside.discard(player.id)
+        next_room.players_inside.add(player.id)
 
         # Player observes new room
         player.observe(next_room, players_map)
@@ -166,12 +185,8 @@ class TurnSystem:
             player.id, current_room.id, direction, next_room.id
         )
 
-        # Get witnesses AFTER player moves (from updated player locations)
-        witnesses_after = [
-            pid
-            for pid, p in players_map.items()
-            if p.room_id == next_room.id and pid != player.id
-        ]
+        # Get witnesses AFTER player moves (from updated room occupancy)
+        witnesses_after = [pid for pid in next_room.players_inside if pid != player.id]
 
         # Notify witnesses player has entered
         self.event_bus.notify_player_entered_room(
@@ -188,6 +203,7 @@ class TurnSystem:
         player: Player,
         action_key: str,
         players_map: dict[str, Player],
+        prefetched_details: Optional[tuple[tuple, str]] = None,
     ) -> bool:
         """
         Process a player's action.
@@ -196,13 +212,16 @@ class TurnSystem:
             player: The player performing the action
             action_key: The action key (e.g., "TALK", "INTERACT")
             players_map: Dictionary of all players
+            prefetched_details: Optional (action state, details) generated ahead
+                                of the turn; used instead of asking the
+                                controller if the room has not changed since
 
         Returns:
             True if successful
 
         Time Complexity: O(N) where N is players in room
         """
-        print(f"Processing action for player {player.id}: {action_key}")
+        logger.debug("Processing action for player {}: {}", player.id, action_key)
 
         current_room = self.world_generator.get_room(player.room_id)
         if not current_room:
@@ -212,13 +231,16 @@ class TurnSystem:
         action = GameConfigs._actions[action_key]
 
         # Use controller to get action details - pass room context for NPCs
-        action_prompt = player.controller.provide_action_details(
-            action, current_room, players_map
-        )
+        if prefetched_details and prefetched_details[0] == self._action_state(
+            action_key, current_room
+        ):
+            action_prompt = prefetched_details[1]
+        else:
+            action_prompt = player.controller.provide_action_details(
+                action, current_room, players_map
+            )
 
         if action.name == ActionType.TALK.value:
-            from utils import Colors
-
             print(
                 Colors.data_change(
                     f"Player {player.name} says: '{action_prompt}' to players in room {current_room.name}"
@@ -226,8 +248,6 @@ class TurnSystem:
             )
 
         elif action.name == ActionType.INTERACT.value:
-            from utils import Colors
-
             print(
                 Colors.data_change(
                     f"Player {player.name} interacts with the room {current_room.name}: {action_prompt}"
@@ -248,12 +268,8 @@ class TurnSystem:
             # **CRITICAL**: Persist updated room description to database
             self.world_generator.room_repo.update(current_room)
 
-        # Get witnesses (from current player locations)
-        witnesses = [
-            pid
-            for pid, p in players_map.items()
-            if p.room_id == current_room.id and pid != player.id
-        ]
+        # Get witnesses (from current room occupancy)
+        witnesses = [pid for pid in current_room.players_inside if pid != player.id]
 
         # Notify all witnesses
         self.event_bus.notify_player_action(
@@ -280,6 +296,7 @@ class TurnSystem:
         players_map: dict[str, Player],
         map_dict: dict[tuple[int, int], str],
         rooms_dict: dict[str, Room],
+        draw_map: bool = True,
     ) -> None:
         """
         Announce the current situation for a player's turn.
@@ -289,6 +306,7 @@ class TurnSystem:
             players_map: Dictionary of all players
             map_dict: Coordinate to room_id mapping
             rooms_dict: Dictionary of all rooms (with populated players_inside)
+            draw_map: Whether to draw the map for this turn
         """
         # Use room from rooms_dict which has populated players_inside
         current_room = rooms_dict.get(player.room_id)
@@ -296,8 +314,14 @@ class TurnSystem:
             print(f"Error: Current room {player.room_id} not found")
             return
 
-        # Draw map
-        self.renderer.draw_map(rooms_dict, map_dict, player.id, players_map)
+        if draw_map:
+            self.renderer.draw_map(
+                rooms_dict,
+                map_dict,
+                player.id,
+                players_map,
+                bounds=self.world_generator.get_map_bounds(),
+            )
 
         # Announce turn
         print(f"\033[93m\n--- Player {player.name}'s Turn ---\033[0m")
@@ -314,6 +338,143 @@ class TurnSystem:
         else:
             print("\033[93mYou are alone in this room.\033[0m")
 
+    def _build_decision_context(
+        self, player: Player, current_room: Room
+    ) -> tuple[list[str], list[str], dict]:
+        """
+        Gather what a player can do this turn.
+
+        Args:
+            player: The player about to decide
+            current_room: The player's room (with populated players_inside)
+
+        Returns:
+            Tuple of (available moves, available action keys, decision context)
+        """
+        available_moves = self.get_player_moves(player)
+        has_others = len(current_room.players_inside) > 1
+        available_action_keys = self.get_player_actions(player, has_others)
+        context = {
+            "available_directions": available_moves,
+            "available_actions": [
+                GameConfigs._actions[key] for key in available_action_keys
+            ],
+            "current_room": current_room,
+            "player_memory": player.memory,
+        }
+        return available_moves, available_action_keys, context
+
+    @staticmethod
+    def _action_state(action_key: str, room: Room) -> tuple:
+        """
+        Snapshot everything an NPC's action details are generated from.
+
+        Args:
+            action_key: The action being performed
+            room: The room the action takes place in
+
+        Returns:
+            A hashable key; prefetched details are only reused if it still matches
+        """
+        return (action_key, room.id, room.description, frozenset(room.players_inside))
+
+    def prefetch_npc_decisions(
+        self,
+        turn_order: tuple[Player, ...],
+        rooms_dict: dict[str, Room],
+        players_map: dict[str, Player],
+    ) -> tuple[dict[str, str], dict[str, tuple[tuple, str]]]:
+        """
+        Ask every NPC for its decision of the coming round concurrently.
+
+        Each NPC's LLM round-trip overlaps with the others instead of running
+        back to back on its own turn. NPCs that choose an action then get their
+        action details the same way. Everything is generated from the state at
+        the start of the round, so the caller must check each decision is still
+        available when the NPC's turn comes, and details are only used if the
+        room is unchanged (see process_player_action). Humans are never asked
+        ahead.
+
+        Args:
+            turn_order: Players in turn order
+            rooms_dict: Dictionary of all rooms (with populated players_inside)
+            players_map: Dictionary of all players
+
+        Returns:
+            Tuple of (player_id -> decision, player_id -> (action state, details)),
+            for the NPCs that made one
+
+        Time Complexity: O(N_npcs), with about two LLM round-trips of latency
+        """
+        planned = []
+        for player in turn_order:
+            if player.player_type != PlayerType.NPC:
+                continue
+            current_room = rooms_dict.get(player.room_id)
+            if not current_room:
+                continue
+            _, _, context = self._build_decision_context(player, current_room)
+            planned.append((player, context))
+
+        if len(planned) < 2:
+            return {}, {}
+        return self._prefetch_concurrently(planned, players_map)
+
+    def _prefetch_concurrently(
+        self, planned: list[tuple[Player, dict]], players_map: dict[str, Player]
+    ) -> tuple[dict[str, str], dict[str, tuple[tuple, str]]]:
+        """
+        Get the ACT decisions, then the action details, of several players together.
+
+        Args:
+            planned: (player, decision context) pairs
+            players_map: Dictionary of all players
+
+        Returns:
+            Same as prefetch_npc_decisions; players whose LLM call failed are
+            left out, to run it again on their own turn
+        """
+        executor = self._prefetch_executor
+        decision_futures = [
+            executor.submit(player.controller.decide, DecisionType.ACT, context)
+            for player, context in planned
+        ]
+        prefetched = {}
+        acting = []
+        for (player, context), future in zip(planned, decision_futures):
+            try:
+                decision = future.result()
+            except Exception as e:
+                logger.debug("Prefetching decision for {} failed: {}", player.name, e)
+                continue
+            prefetched[player.id] = decision
+            if decision in GameConfigs._actions:
+                acting.append((player, decision, context["current_room"]))
+
+        detail_futures = [
+            executor.submit(
+                player.controller.provide_action_details,
+                GameConfigs._actions[action_key],
+                room,
+                players_map,
+            )
+            for player, action_key, room in acting
+        ]
+        prefetched_details = {}
+        for (player, action_key, room), future in zip(acting, detail_futures):
+            try:
+                detail = future.result()
+            except Exception as e:
+                logger.debug(
+                    "Prefetching action details for {} failed: {}", player.name, e
+                )
+                continue
+            prefetched_details[player.id] = (
+                self._action_state(action_key, room),
+                detail,
+            )
+        return prefetched, prefetched_details
+
     def run_game_loop(
         self,
         players_map: dict[str, Player],
@@ -326,18 +487,54 @@ class TurnSystem:
 
         Time Complexity: O(N_players * (1 + N_new_rooms_per_turn)) per round
         """
+        # Turn order is fixed for the whole game: snapshot it once, and hoist the
+        # attributes used on every turn into locals
+        turn_order = tuple(players_map.values())
+        world_generator = self.world_generator
+        process_player_move = self.process_player_move
+        process_player_action = self.process_player_action
+
+        # With humans playing, the map is only drawn on human turns; in NPC-only
+        # games one overview map is drawn per round instead
+        has_humans = any(p.player_type == PlayerType.HUMAN for p in turn_order)
+
+        # Occupancy is populated once here, then kept up to date by
+        # process_player_move on the shared Room objects
+        self._populate_room_occupancy(world_generator.get_rooms_dict(), players_map)
+
+        # Player positions shown on the last round overview map. New rooms are
+        # only created by moves, so unchanged positions mean an unchanged map.
+        drawn_state = None
+
         while True:
-            for player_id, player in players_map.items():
-                # Get fresh rooms dict and populate occupancy
-                rooms_dict = self.world_generator.get_rooms_dict()
-                self._populate_room_occupancy(rooms_dict, players_map)
+            prefetched, prefetched_details = {}, {}
+            if GameConstants.PARALLEL_NPC_DECISIONS:
+                prefetched, prefetched_details = self.prefetch_npc_decisions(
+                    turn_order, world_generator.get_rooms_dict(), players_map
+                )
+
+            if not has_humans:
+                map_state = tuple(p.room_id for p in turn_order)
+                if map_state != drawn_state:
+                    self.renderer.draw_map(
+                        world_generator.get_rooms_dict(),
+                        world_generator.get_map_dict(),
+                        None,
+                        players_map,
+                        bounds=world_generator.get_map_bounds(),
+                    )
+                    drawn_state = map_state
+
+            for player in turn_order:
+                rooms_dict = world_generator.get_rooms_dict()
 
                 # Announce situation
                 self.announce_turn_situation(
                     player,
                     players_map,
-                    self.world_generator.get_map_dict(),
+                    world_generator.get_map_dict(),
                     rooms_dict,  # Pass the populated rooms_dict
+                    draw_map=player.player_type == PlayerType.HUMAN,
                 )
 
                 # Use populated current_room from rooms_dict
@@ -347,57 +544,44 @@ class TurnSystem:
                     continue
 
                 # Get moves and actions available
-                available_moves = self.get_player_moves(player)
-                has_others = len(current_room.players_inside) > 1
-                available_action_keys = self.get_player_actions(player, has_others)
-
-                # Get decision from controller
-                context = {
-                    "available_directions": available_moves,
-                    "available_actions": [
-                        GameConfigs._actions[key] for key in available_action_keys
-                    ],
-                    "current_room": current_room,
-                    "player_memory": player.memory,
-                }
-
-                # Update context with both options
-                full_context = {
-                    **context,
-                    "available_directions": available_moves,
-                    "available_actions": [
-                        GameConfigs._actions[key] for key in available_action_keys
-                    ],
-                }
+                available_moves, available_action_keys, context = (
+                    self._build_decision_context(player, current_room)
+                )
 
                 # Ask controller: do you want to MOVE or perform an ACTION?
                 # Controller should return "MOVE" or an action name like "TALK", "INTERACT", etc.
-                decision = player.controller.decide(DecisionType.ACT, full_context)
+                decision = prefetched.pop(player.id, None)
+                if not (
+                    decision in available_moves or decision in available_action_keys
+                ):
+                    # Not prefetched, or no longer possible after earlier turns
+                    decision = player.controller.decide(DecisionType.ACT, context)
 
                 if decision in available_moves:
                     # Player chose to MOVE
-                    from utils import Colors
-
                     print(
                         Colors.data_change(
                             f"\nPlayer <{player.name}> chose to MOVE {decision}."
                         )
                     )
-                    self.process_player_move(player, decision, players_map)
+                    process_player_move(player, decision, players_map)
                 elif decision in available_action_keys:
                     # Player chose an ACTION
                     print(f"\nPlayer <{player.name}> chose to {decision}.")
-                    self.process_player_action(player, decision, players_map)
+                    process_player_action(
+                        player,
+                        decision,
+                        players_map,
+                        prefetched_details.pop(player.id, None),
+                    )
                 else:
                     # Invalid decision, default to random move or action
-                    import random
-
                     print(
                         f"\nInvalid decision '{decision}', defaulting to random action."
                     )
                     if available_moves:
                         chosen_move = random.choice(available_moves)
-                        self.process_player_move(player, chosen_move, players_map)
+                        process_player_move(player, chosen_move, players_map)
                     elif available_action_keys:
                         chosen_action = random.choice(available_action_keys)
-                        self.process_player_action(player, chosen_action, players_map)
+                        process_player_action(player, chosen_action, players_map)
@@ -2,14 +2,17 @@
 World generator for creating and managing rooms using database persistence.
 """
 
+import json
 import random
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from sqlalchemy.orm import Session
 
-from config import GameConfigs
+from config import MOVE_POLES, MOVE_TRANSLATIONS
 from config.constants import GameConstants
-from llm import LLMModule, PromptTemplates, create_llm_module
+from llm import LLMModule, PromptTemplates, create_llm_module, world_cache
+from logger import logger
 from models import Room
 from repositories import RoomRepository
 
@@ -32,39 +35,45 @@ class WorldGenerator:
         self.world_id = world_id
         self.room_repo = RoomRepository(session, world_id)
 
-        # LLM for room descriptions
+        # Coordinate -> room_id map, loaded once and kept up to date as rooms are
+        # created (this generator is the only writer of rooms for its world)
+        self._map: Optional[dict[tuple[int, int], str]] = None
+
+        # Identity map of room_id -> Room, loaded once; rooms are updated in place
+        # and persisted, so every caller shares the same Room objects
+        self._rooms: Optional[dict[str, Room]] = None
+
+        # Room IDs kept in memory for O(1) random selection (loaded lazily)
+        self._room_ids: Optional[list[str]] = None
+
+        # Map bounding box (min_x, max_x, min_y, max_y), kept up to date incrementally
+        self._bounds: Optional[tuple[int, int, int, int]] = None
+
+        # LLM for room descriptions (its cache is persisted between sessions)
         self.dm_generator_module: LLMModule = create_llm_module(
-            PromptTemplates.DM_SYSTEM_PROMPT
+            PromptTemplates.DM_SYSTEM_PROMPT, cache=world_cache
         )
 
-    def _translate(
-        self, current_coords: tuple[int, int], move_direction: str
-    ) -> tuple[int, int]:
-        """
-        Translate coordinates in a given direction.
-
-        Time Complexity: O(1)
-        """
-        translation = GameConfigs._moves[move_direction].translate
-        new_coords = (
-            current_coords[0] + translation[0],
-            current_coords[1] + translation[1],
+        # Independent LLM calls (new room + its neighbours) run concurrently
+        self._llm_executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="world-gen-llm"
         )
-        return new_coords
 
-    def _get_adjacent_rooms(self, room: Room) -> dict[str, Optional[Room]]:
+    def _get_adjacent_rooms(self, room: Room) -> list[tuple[str, Optional[Room]]]:
         """
-        Get all adjacent rooms to a given room.
+        Get all adjacent rooms to a given room as (direction, room or None) pairs.
+
+        Neighbours are probed in the in-memory map; only rooms that exist are
+        loaded from the database.
 
         Time Complexity: O(1) - fixed number of directions
         """
-        adjacent_coords = {
-            d: self._translate(room.coords, d) for d in GameConfigs._moves.keys()
-        }
-        rooms = {}
-        for d, c in adjacent_coords.items():
-            adjacent_room = self.room_repo.get_by_coords(c[0], c[1])
-            rooms[d] = adjacent_room
+        room_map = self._get_map()
+        x, y = room.coords
+        rooms = []
+        for d, (dx, dy) in MOVE_TRANSLATIONS.items():
+            room_id = room_map.get((x + dx, y + dy))
+            rooms.append((d, self.get_room(room_id) if room_id else None))
         return rooms
 
     def create_room(
@@ -87,8 +96,10 @@ class WorldGenerator:
         Time Complexity: O(1)
         The number of adjacent rooms and potential paths is constant (max 4).
         """
-        print(
-            f"Creating room at {coords} from room {from_room.id if from_room else 'None'}"
+        logger.debug(
+            "Creating room at {} from room {}",
+            coords,
+            from_room.id if from_room else None,
         )
 
         room = Room(coords)
@@ -102,87 +113,156 @@ class WorldGenerator:
             paths[from_direction] = from_room.id
 
         # Prioritize connections to adjacent rooms that are already pointing here
-        for d, aroom in adjacent_rooms.items():
+        for d, aroom in adjacent_rooms:
             if len(paths) >= GameConstants.MAX_ROOM_PATHS:
                 break
             if d in paths:
                 continue
             if aroom:
-                pole = GameConfigs._moves[d].pole
+                pole = MOVE_POLES[d]
                 if pole in aroom.paths and aroom.paths[pole] is None:
                     paths[d] = aroom.id
 
         # Fill remaining path slots randomly from other valid potential paths
         if len(paths) < GameConstants.MAX_ROOM_PATHS:
-            potential_paths = {}
-            for d, aroom in adjacent_rooms.items():
+            potential_paths = []
+            for d, aroom in adjacent_rooms:
                 if d in paths:
                     continue
                 if aroom is None:
-                    potential_paths[d] = None
-                    continue
-                if len(aroom.paths) < GameConstants.MAX_ROOM_PATHS:
-                    potential_paths[d] = aroom.id
-                    continue
+                    potential_paths.append((d, None))
+                elif len(aroom.paths) < GameConstants.MAX_ROOM_PATHS:
+                    potential_paths.append((d, aroom.id))
 
             remaining_slots = GameConstants.MAX_ROOM_PATHS - len(paths)
-            num_to_sample = min(len(potential_paths), remaining_slots)
+            random.shuffle(potential_paths)
+            paths.update(potential_paths[:remaining_slots])
 
-            if num_to_sample > 0:
-                new_path_directions = random.sample(
-                    list(potential_paths.keys()), num_to_sample
-                )
-                new_paths = {d: potential_paths[d] for d in new_path_directions}
-                paths.update(new_paths)
+        logger.debug("New paths for room {}: {}", room.id, paths)
+        room.paths = paths
 
-        print(f"New paths for room {room.id}: {paths}")
+        # Wire up the rooms we are now connected to
+        connections = []
+        for d, room_id in room.paths.items():
+            if room_id:
+                aroom = self.get_room(room_id)
+                if aroom:
+                    pole = MOVE_POLES[d]
+                    aroom.paths[pole] = room.id
+                    connections.append((aroom, pole))
+
+        # Generate the new room's description and the neighbours' updates concurrently
+        description_future = self._llm_executor.submit(
+            self.dm_generator_module.get_response, self._room_description_prompt(room)
+        )
+        connections_future = self._llm_executor.submit(
+            self._describe_new_connections, room, connections
+        )
+
+        room.update_description(description_future.result())
 
-        # Generate room description using LLM
+        # Save room to database
+        self.room_repo.add(room)
+        self._get_rooms()[room.id] = room
+        self._get_map()[room.coords] = room.id
+        self._get_room_ids().append(room.id)
+        self._extend_bounds(room.coords)
+
+        # Update descriptions of connected rooms
+        new_descriptions = connections_future.result()
+        for aroom, _ in connections:
+            new_description = new_descriptions[aroom.id]
+
+            logger.debug(
+                "Adjacent room {} updated:\nFROM = {}\nTO = {}",
+                aroom.name,
+                aroom.description,
+                new_description,
+            )
+
+            aroom.update_description(new_description)
+            # Update in database
+            self.room_repo.update(aroom)
+
+        return room
+
+    @staticmethod
+    def _room_description_prompt(room: Room) -> str:
+        """Build the LLM prompt describing a room from its name and current paths."""
         path_descriptions = {
-            d: desc if desc is not None else "unknown" for d, desc in paths.items()
+            d: desc if desc is not None else "unknown" for d, desc in room.paths.items()
         }
-        prompt = PromptTemplates.WORLD_GEN_ROOM_DESCRIPTION.substitute(
+        return PromptTemplates.WORLD_GEN_ROOM_DESCRIPTION.substitute(
             word_count=GameConstants.DEFAULT_DESCRIPTION_WORDS,
             room_name=room.name,
             room_paths=path_descriptions,
         )
-        description = self.dm_generator_module.get_response(prompt)
-        room.update_description(description)
-        room.paths = paths
 
-        # Save room to database
-        self.room_repo.add(room)
+    def close(self) -> None:
+        """Stop the LLM worker threads."""
+        self._llm_executor.shutdown()
 
-        # Update paths of connected rooms
-        for d, room_id in room.paths.items():
-            if room_id:
-                aroom = self.room_repo.get(room_id)
-                if aroom:
-                    aroom.paths[GameConfigs._moves[d].pole] = room.id
-
-                    prompt = PromptTemplates.WORLD_GEN_ROOM_CONNECTION.substitute(
-                        room_name=aroom.name,
-                        new_room_name=room.name,
-                        direction=GameConfigs._moves[d].pole,
-                        current_description=aroom.description,
-                    )
-                    new_description = self.dm_generator_module.get_response(prompt)
-
-                    print(
-                        f"\033[92m"
-                        f"""
-                    Adjacent room {aroom.name} updated:
-                    FROM = {aroom.description}.
-                    
-                    TO = {new_description}"""
-                        f"\033[0m\n"
-                    )
-
-                    aroom.update_description(new_description)
-                    # Update in database
-                    self.room_repo.update(aroom)
+    def _describe_new_connections(
+        self, room: Room, connections: list[tuple[Room, str]]
+    ) -> dict[str, str]:
+        """
+        Generate updated descriptions for rooms newly connected to a room.
 
-        return room
+        All neighbours are described in a single batched LLM request; any room
+        missing from the batched reply falls back to an individual request.
+
+        Args:
+            room: The newly created room
+            connections: (adjacent room, direction of the new room from it) pairs
+
+        Returns:
+            Dictionary of adjacent room_id -> updated description
+        """
+        if not connections:
+            return {}
+
+        new_descriptions = {}
+        if len(connections) > 1:
+            entries = "\n\n".join(
+                PromptTemplates.WORLD_GEN_ROOM_CONNECTION_ENTRY.substitute(
+                    room_id=aroom.id,
+                    room_name=aroom.name,
+                    direction=direction,
+                    current_description=aroom.description,
+                )
+                for aroom, direction in connections
+            )
+            prompt = PromptTemplates.WORLD_GEN_ROOM_CONNECTIONS_BATCH.substitute(
+                new_room_name=room.name, connections=entries
+            )
+            new_descriptions = self._parse_json_object(
+                self.dm_generator_module.get_response(prompt)
+            )
+
+        for aroom, direction in connections:
+            if not isinstance(new_descriptions.get(aroom.id), str):
+                prompt = PromptTemplates.WORLD_GEN_ROOM_CONNECTION.substitute(
+                    room_name=aroom.name,
+                    new_room_name=room.name,
+                    direction=direction,
+                    current_description=aroom.description,
+                )
+                new_descriptions[aroom.id] = self.dm_generator_module.get_response(
+                    prompt
+                )
+        return new_descriptions
+
+    @staticmethod
+    def _parse_json_object(text: str) -> dict:
+        """Extract a JSON object from an LLM reply (tolerates code fences)."""
+        start, end = text.find("{"), text.rfind("}")
+        if start == -1 or end < start:
+            return {}
+        try:
+            parsed = json.loads(text[start : end + 1])
+        except json.JSONDecodeError:
+            return {}
+        return parsed if isinstance(parsed, dict) else {}
 
     def create_world(self, starting_room_coords: tuple[int, int] = (0, 0)) -> Room:
         """
@@ -202,26 +282,90 @@ class WorldGenerator:
         return starting_room
 
     def get_room(self, room_id: str) -> Optional[Room]:
-        """Get a room by ID from database."""
-        return self.room_repo.get(room_id)
+        """Get a room by ID."""
+        return self._get_rooms().get(room_id)
 
     def get_room_at_coords(self, coords: tuple[int, int]) -> Optional[Room]:
-        """Get a room at specific coordinates from database."""
-        return self.room_repo.get_by_coords(coords[0], coords[1])
+        """Get a room at specific coordinates."""
+        room_id = self._get_map().get(coords)
+        return self.get_room(room_id) if room_id else None
 
     def room_exists_at_coords(self, coords: tuple[int, int]) -> bool:
         """Check if a room exists at coordinates."""
-        return self.room_repo.get_by_coords(coords[0], coords[1]) is not None
+        return coords in self._get_map()
+
+    def _get_rooms(self) -> dict[str, Room]:
+        """Get the in-memory room identity map, loading it from the database once."""
+        if self._rooms is None:
+            self._rooms = {room.id: room for room in self.room_repo.get_all()}
+        return self._rooms
+
+    def _get_map(self) -> dict[tuple[int, int], str]:
+        """Get the in-memory coordinate map, loading it from the database once."""
+        if self._map is None:
+            self._map = self.room_repo.get_map()
+        return self._map
+
+    def _get_room_ids(self) -> list[str]:
+        """Get the in-memory room ID list, built from the coordinate map once."""
+        if self._room_ids is None:
+            self._room_ids = list(self._get_map().values())
+        return self._room_ids
 
     def get_all_room_ids(self) -> list[str]:
-        """Get list of all room IDs from database."""
-        return self.room_repo.get_all_ids()
+        """Get list of all room IDs."""
+        return list(self._get_room_ids())
+
+    def get_random_room_id(self) -> Optional[str]:
+        """
+        Get a random room ID, or None if the world has no rooms.
+
+        Time Complexity: O(1)
+        """
+        room_ids = self._get_room_ids()
+        return random.choice(room_ids) if room_ids else None
 
     def get_rooms_dict(self) -> dict[str, Room]:
-        """Get dictionary of all rooms from database."""
-        rooms = self.room_repo.get_all()
-        return {room.id: room for room in rooms}
+        """
+        Get dictionary of all rooms.
+
+        Time Complexity: O(N_rooms) shallow copy of the identity map; rooms are
+        only loaded from the database on first use
+        """
+        return dict(self._get_rooms())
+
+    def _extend_bounds(self, coords: tuple[int, int]) -> None:
+        """Grow the map bounding box to include coords. Time Complexity: O(1)"""
+        bounds = self.get_map_bounds()
+        if bounds is None:
+            self._bounds = (coords[0], coords[0], coords[1], coords[1])
+            return
+        min_x, max_x, min_y, max_y = bounds
+        self._bounds = (
+            min(min_x, coords[0]),
+            max(max_x, coords[0]),
+            min(min_y, coords[1]),
+            max(max_y, coords[1]),
+        )
+
+    def get_map_bounds(self) -> Optional[tuple[int, int, int, int]]:
+        """
+        Get the map bounding box as (min_x, max_x, min_y, max_y).
+
+        Computed from the database on first use, then maintained as rooms are
+        created. Returns None if the world has no rooms.
+        """
+        if self._bounds is None:
+            coords = self._get_map().keys()
+            if coords:
+                self._bounds = (
+                    min(c[0] for c in coords),
+                    max(c[0] for c in coords),
+                    min(c[1] for c in coords),
+                    max(c[1] for c in coords),
+                )
+        return self._bounds
 
     def get_map_dict(self) -> dict[tuple[int, int], str]:
-        """Get coordinate to room_id mapping from database."""
-        return self.room_repo.get_map()
+        """Get coordinate to room_id mapping."""
+        return dict(self._get_map())